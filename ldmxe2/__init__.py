@@ -16,9 +16,10 @@ from homeassistant.core import HomeAssistant, callback
 from .ldmxe2 import LumizeDMXEngine2
 from .const import (
     DOMAIN,
-    LDMXE2_INSTANCE,
+    LDMXE2_INSTANCES,
     LDMXE2_ENTITIES,
     CONF_KEEP_ALIVE,
+    CONF_UNIVERSES,
     DEFAULT_PORT,
     DEFAULT_KEEP_ALIVE,
     SERVICE_DIM_START,
@@ -32,16 +33,22 @@ PLATFORMS: list[Platform] = [Platform.LIGHT]
 # Set up Home Assistant logger with this file's name
 _LOGGER = logging.getLogger(__name__)
 
+# Engine connection schema, used for universe 0 and every additional universe
+ENGINE_SCHEMA = {
+    vol.Required(CONF_HOST): cv.string,
+    vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.positive_int,
+    vol.Optional(CONF_KEEP_ALIVE, default=DEFAULT_KEEP_ALIVE): cv.positive_int,
+}
+
 # Config schema definition
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
             {
-                vol.Required(CONF_HOST): cv.string,
-                vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.positive_int,
-                vol.Optional(
-                    CONF_KEEP_ALIVE, default=DEFAULT_KEEP_ALIVE
-                ): cv.positive_int,
+                **ENGINE_SCHEMA,
+                vol.Optional(CONF_UNIVERSES, default=[]): vol.All(
+                    cv.ensure_list, [vol.Schema(ENGINE_SCHEMA)]
+                ),
             }
         )
     },
@@ -52,22 +59,29 @@ CONFIG_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config) -> bool:
     """Set up Lumize DMX Engine 2 from config"""
 
-    # Get configuration parameters
+    # Get configuration parameters, the main engine drives universe 0 and
+    # every engine in the universes list drives the next universe
     conf = config[DOMAIN]
-    host = conf[CONF_HOST]
-    port = conf[CONF_PORT]
-    keep_alive = conf[CONF_KEEP_ALIVE]
+    engines = [conf] + conf[CONF_UNIVERSES]
+
+    # Create one ldmxe2 instance per universe
+    ldmxe2_instances: dict[int, LumizeDMXEngine2] = {}
+    for universe, engine in enumerate(engines):
+        host = engine[CONF_HOST]
+        port = engine[CONF_PORT]
+        keep_alive = engine[CONF_KEEP_ALIVE]
+
+        _LOGGER.debug("Starting connection to host %s, universe: %d", host, universe)
 
-    _LOGGER.debug("Starting connection to host %s", host)
+        ldmxe2 = LumizeDMXEngine2(host, int(port), _LOGGER.debug, keep_alive)
 
-    # Create ldmxe2 instance
-    ldmxe2 = LumizeDMXEngine2(host, int(port), _LOGGER.debug, keep_alive)
+        # Start the connection to engine
+        ldmxe2.start()
 
-    # Start the connection to engine
-    ldmxe2.start()
+        ldmxe2_instances[universe] = ldmxe2
 
-    # Save instance to be able to use it from platforms
-    hass.data[LDMXE2_INSTANCE] = ldmxe2
+    # Save instances to be able to use them from platforms
+    hass.data[LDMXE2_INSTANCES] = ldmxe2_instances
 
     # Init entites list to be used for services
     hass.data[LDMXE2_ENTITIES] = []
@@ -108,6 +122,10 @@ async def async_setup(hass: HomeAssistant, config) -> bool:
     hass.services.async_register(DOMAIN, SERVICE_DIM_START, handle_services)
     hass.services.async_register(DOMAIN, SERVICE_DIM_STOP, handle_services)
 
-    _LOGGER.info("Setup completed, host: %s", host)
+    _LOGGER.info(
+        "Setup completed, host: %s, universes: %d",
+        conf[CONF_HOST],
+        len(ldmxe2_instances),
+    )
 
     return True
@@ -4,7 +4,7 @@
 DOMAIN = "ldmxe2"
 
 # Hass.data keys
-LDMXE2_INSTANCE = "ldmxe2_instance"
+LDMXE2_INSTANCES = "ldmxe2_instances"
 LDMXE2_ENTITIES = "ldmxe2_entities"
 
 # Services
@@ -13,6 +13,8 @@ SERVICE_DIM_STOP = "dim_stop"
 
 # Configuration keys
 CONF_CHANNEL = "channel"
+CONF_UNIVERSE = "universe"
+CONF_UNIVERSES = "universes"
 CONF_KEEP_ALIVE = "keep_alive"
 
 # Default configuration
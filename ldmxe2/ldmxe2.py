@@ -5,6 +5,7 @@ from types import FunctionType
 from .tcp import TcpConnection, NotConnected  # TcpConnection class
 
 KEEP_ALIVE_DEFAULT: int = 0  # seconds
+CHANNELS_PER_UNIVERSE: int = 512
 
 # Exception types
 class SendError(Exception):
@@ -179,14 +180,23 @@ class LumizeDMXEngine2:
 
     def stop(self) -> None:
         """Stop connection to the Lumize DMX Engine 2"""
-        self.__connection.start()
         self.__connection.stop()
 
+    @property
+    def connect_attempts(self) -> int:
+        """Returns the number of connection attempts to the engine so far"""
+        return self.__connection.connect_attempts
+
+    @property
+    def connects(self) -> int:
+        """Returns the number of successful connections to the engine so far"""
+        return self.__connection.connects
+
     def get_light_entity(self, channel: int) -> LumizeDMXEngine2Light:
         """Returns LumizeDMXEngine2Light object for given channel"""
 
         # See if channel is in range
-        if channel < 0 or channel >= 512:
+        if channel < 0 or channel >= CHANNELS_PER_UNIVERSE:
             raise WrongChannel
 
         return LumizeDMXEngine2Light(self.__connection, channel)
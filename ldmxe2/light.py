@@ -24,8 +24,13 @@ from homeassistant.components.light import (
 )
 
 # Local imports
-from .ldmxe2 import SendError, LumizeDMXEngine2, LumizeDMXEngine2Light
-from .const import LDMXE2_INSTANCE, CONF_CHANNEL, LDMXE2_ENTITIES
+from .ldmxe2 import (
+    SendError,
+    LumizeDMXEngine2,
+    LumizeDMXEngine2Light,
+    CHANNELS_PER_UNIVERSE,
+)
+from .const import LDMXE2_INSTANCES, CONF_CHANNEL, CONF_UNIVERSE, LDMXE2_ENTITIES
 
 
 # Get logger for this file's name
@@ -35,7 +40,10 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_NAME): cv.string,
-        vol.Required(CONF_CHANNEL): cv.positive_int,
+        vol.Required(CONF_CHANNEL): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=CHANNELS_PER_UNIVERSE - 1)
+        ),
+        vol.Optional(CONF_UNIVERSE, default=0): cv.positive_int,
     }
 )
 
@@ -50,20 +58,30 @@ def setup_platform(
 
     # Get config parameters
     name: cv.string = config[CONF_NAME]
-    channel: cv.positive_int = config[CONF_CHANNEL]
+    channel: int = config[CONF_CHANNEL]
+    universe: cv.positive_int = config[CONF_UNIVERSE]
 
     # Add devices
-    _LOGGER.debug("Setting up light %s, channel: %d", name, channel)
+    _LOGGER.debug(
+        "Setting up light %s, universe: %d, channel: %d", name, universe, channel
+    )
 
     # Check that the platform has been setup
-    if not LDMXE2_INSTANCE in hass.data:
+    if not LDMXE2_INSTANCES in hass.data:
+        return False
+
+    # Check that an engine is configured for the light's universe
+    if not universe in hass.data[LDMXE2_INSTANCES]:
+        _LOGGER.error("No engine configured for universe %d, light %s", universe, name)
         return False
 
-    # Get LumizeDMXEngine2 object from hass.data
-    ldmxe2: LumizeDMXEngine2 = hass.data[LDMXE2_INSTANCE]
+    # Get LumizeDMXEngine2 object of the universe from hass.data
+    ldmxe2: LumizeDMXEngine2 = hass.data[LDMXE2_INSTANCES][universe]
 
     # Generate entity
-    entity = LumizeDMXEngine2LightEntity(name, ldmxe2.get_light_entity(channel))
+    entity = LumizeDMXEngine2LightEntity(
+        name, ldmxe2.get_light_entity(channel), universe
+    )
 
     # Append entity to local list used for services
     hass.data[LDMXE2_ENTITIES].append(entity)
@@ -77,7 +95,9 @@ def setup_platform(
 class LumizeDMXEngine2LightEntity(LightEntity):
     """Representation of an Lumize DMX Engine 2 Light."""
 
-    def __init__(self, name, ldmxe2_light: LumizeDMXEngine2Light) -> None:
+    def __init__(
+        self, name, ldmxe2_light: LumizeDMXEngine2Light, universe: int = 0
+    ) -> None:
         """Initialize an LumizeDMXEngine2Light"""
 
         # Light object
@@ -85,7 +105,15 @@ class LumizeDMXEngine2LightEntity(LightEntity):
 
         # Entity properties
         self._name = name
-        self._attr_unique_id = f"{self._ldmxe2_light.host}-{self._ldmxe2_light.channel}"
+        # Keep universe 0 ids unchanged so existing entities keep their settings
+        if universe == 0:
+            self._attr_unique_id = (
+                f"{self._ldmxe2_light.host}-{self._ldmxe2_light.channel}"
+            )
+        else:
+            self._attr_unique_id = (
+                f"{self._ldmxe2_light.host}-{universe}-{self._ldmxe2_light.channel}"
+            )
         self._attr_supported_features = LightEntityFeature.TRANSITION
         self._attr_supported_color_modes: set[ColorMode] = set()
         self._attr_supported_color_modes.add(ColorMode.BRIGHTNESS)
@@ -44,6 +44,8 @@ class TcpConnection:
         # Setup state variables
         self.__running: bool = True
         self.__is_connected: bool = False
+        self.__connect_attempts: int = 0
+        self.__connects: int = 0
 
         self.__keep_alive_cv = multiprocessing.Condition()
         self.__keep_alive_thread = threading.Thread(target=self.__keep_alive)
@@ -92,6 +94,16 @@ class TcpConnection:
         """Is the connection ok"""
         return self.__is_connected
 
+    @property
+    def connect_attempts(self) -> int:
+        """Returns the number of connection attempts made so far"""
+        return self.__connect_attempts
+
+    @property
+    def connects(self) -> int:
+        """Returns the number of successful connections made so far"""
+        return self.__connects
+
     def __reconnect(self):
         self.__logger(
             f"[TCP] Attepting connection to {self.__host}, port: {self.__port}"
@@ -99,6 +111,8 @@ class TcpConnection:
 
         # Lock socket mutex
         with self.__socket_lock:
+            self.__connect_attempts += 1
+
             try:
                 # Create socket
                 self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -123,6 +137,7 @@ class TcpConnection:
                 self.__logger("[TCP] Connected!")
 
                 self.__is_connected = True
+                self.__connects += 1
                 # self.__socket.settimeout(None)
             else:
                 self.__logger(
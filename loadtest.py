@@ -0,0 +1,455 @@
+"""Lumize DMX Engine 2 load test tool
+
+Simulates a number of light entities sharing a single LumizeDMXEngine2
+connection and drives on/off/sreq/pfstart traffic through it at a target rate.
+Can run against a real engine or against a local mock server.
+
+Usage examples:
+    python loadtest.py --mock --entities 64 --rate 200 --duration 30
+    python loadtest.py --host 192.168.1.50 --entities 32 --mix on=2,off=2,sreq=1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import socketserver
+import sys
+import threading
+import time
+import types
+
+# Make the ldmxe2 modules importable without running the package __init__,
+# which depends on Home Assistant
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ldmxe2")
+if "ldmxe2" not in sys.modules:
+    _package = types.ModuleType("ldmxe2")
+    _package.__path__ = [PACKAGE_DIR]
+    sys.modules["ldmxe2"] = _package
+
+# pylint: disable=wrong-import-position
+from ldmxe2.ldmxe2 import (
+    CHANNELS_PER_UNIVERSE,
+    LumizeDMXEngine2,
+    LumizeDMXEngine2Light,
+    SendError,
+)
+from ldmxe2.tcp import WELCOME_MESSAGE, CONNECTION_CHECK_MESSAGE
+from ldmxe2.const import DEFAULT_PORT, DEFAULT_KEEP_ALIVE
+
+# Default configuration
+DEFAULT_ENTITIES = 16
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 50.0  # ops/sec, 0 for unlimited
+DEFAULT_DURATION = 10.0  # seconds
+DEFAULT_MIX = "on=3,off=3,sreq=3,pfstart=1"
+
+# Operations that can be part of the traffic mix
+OPERATIONS = ("on", "off", "sreq", "pfstart")
+
+
+class MockEngineHandler(socketserver.BaseRequestHandler):
+    """Handles a single client connection to the mock engine"""
+
+    def handle(self):
+        self.request.sendall(WELCOME_MESSAGE)
+
+        while True:
+            try:
+                data: bytes = self.request.recv(64)
+            except OSError:
+                return
+
+            # Client disconnected
+            if not data:
+                return
+
+            response = self.server.respond(data.decode("utf-8").strip())
+            self.request.sendall(bytes(response + "\n", "utf-8"))
+
+
+class MockEngine(socketserver.ThreadingTCPServer):
+    """Minimal Lumize DMX Engine 2 stand-in that keeps per-channel state"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str, port: int):
+        super().__init__((host, port), MockEngineHandler)
+        self.__states: dict[int, tuple[int, int]] = {}
+        self.__states_lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        """Returns the port the mock engine is listening on"""
+        return self.server_address[1]
+
+    def respond(self, message: str) -> str:
+        """Returns the response to a single command"""
+
+        if message == CONNECTION_CHECK_MESSAGE:
+            return "ok"
+
+        message_split = message.split(",")
+        try:
+            channel = int(message_split[1])
+        except (IndexError, ValueError):
+            return "err"
+
+        with self.__states_lock:
+            state, brightness = self.__states.get(channel, (0, 255))
+
+            if message_split[0] == "on":
+                for param in message_split[2:]:
+                    if param.startswith("b"):
+                        brightness = int(param[1:])
+                self.__states[channel] = (1, brightness)
+            elif message_split[0] == "off":
+                self.__states[channel] = (0, brightness)
+            elif message_split[0] == "sreq":
+                return f"sres,{channel},{state}-{brightness}"
+            elif message_split[0] not in ("pfstart", "pfend"):
+                return "err"
+
+        return "ok"
+
+    def start(self) -> None:
+        """Starts serving in a background thread"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class Stats:
+    """Thread safe collector of load test results"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__latencies: dict[str, list[float]] = {}
+        self.__errors: dict[str, int] = {}
+
+    def record(self, operation: str, latency: float, error: bool) -> None:
+        """Records the outcome of a single operation"""
+        with self.__lock:
+            if error:
+                self.__errors[operation] = self.__errors.get(operation, 0) + 1
+            else:
+                self.__latencies.setdefault(operation, []).append(latency)
+
+    def report(self, elapsed: float, reconnect_attempts: int, reconnects: int) -> str:
+        """Returns a human readable summary of the results"""
+        with self.__lock:
+            lines = []
+            total_ok = sum(len(values) for values in self.__latencies.values())
+            total_errors = sum(self.__errors.values())
+
+            lines.append(f"Elapsed:      {elapsed:.2f} s")
+            lines.append(f"Completed:    {total_ok} ok, {total_errors} errors")
+            lines.append(f"Throughput:   {total_ok / elapsed:.1f} ops/sec")
+
+            lines.append(
+                f"Reconnects:   {reconnect_attempts} attempts, {reconnects} successful"
+            )
+
+            lines.append("")
+            lines.append(
+                f"{'op':<8}{'ok':>8}{'err':>6}"
+                f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+            )
+            for operation in sorted(set(self.__latencies) | set(self.__errors)):
+                values = sorted(self.__latencies.get(operation, []))
+                lines.append(
+                    f"{operation:<8}{len(values):>8}"
+                    f"{self.__errors.get(operation, 0):>6}"
+                    f"{percentile(values, 50):>10.2f}"
+                    f"{percentile(values, 90):>10.2f}"
+                    f"{percentile(values, 99):>10.2f}"
+                    f"{percentile(values, 100):>10.2f}"
+                )
+
+            return "\n".join(lines)
+
+
+def quiet_logger(_message) -> None:
+    """Logger for LumizeDMXEngine2 that discards all messages"""
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of a sorted list of latencies, in milliseconds"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)] * 1000
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parses a traffic mix in the form on=3,off=3,sreq=3,pfstart=1"""
+    weights: dict[str, float] = {}
+
+    for item in mix.split(","):
+        try:
+            operation, weight = item.split("=")
+            operation = operation.strip()
+            weights[operation] = float(weight)
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(f"invalid mix item: {item}") from error
+
+        if operation not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation: {operation}")
+        if weights[operation] < 0:
+            raise argparse.ArgumentTypeError(f"negative weight: {item}")
+
+    if sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError("mix must have at least one positive weight")
+
+    return weights
+
+
+async def run_operation(light: LumizeDMXEngine2Light, operation: str, stats: Stats):
+    """Runs a single operation on a light and records its outcome"""
+    start = time.perf_counter()
+    try:
+        if operation == "on":
+            await light.turn_on(brightness=random.randint(1, 255))
+        elif operation == "off":
+            await light.turn_off()
+        elif operation == "sreq":
+            await light.get_state()
+        elif operation == "pfstart":
+            await light.pushbutton_fade_start()
+        elif operation == "pfend":
+            await light.pushbutton_fade_end()
+        error = False
+    except (SendError, ValueError, IndexError):
+        error = True
+    stats.record(operation, time.perf_counter() - start, error)
+
+
+class LoadTest:
+    """Drives traffic from a set of simulated entities through one connection"""
+
+    def __init__(
+        self,
+        lights: list[LumizeDMXEngine2Light],
+        mix: dict[str, float],
+        rate: float,
+        duration: float,
+        workers: int,
+        stats: Stats,
+    ):
+        self.__lights = lights
+        self.__operations = list(mix.keys())
+        self.__weights = list(mix.values())
+        self.__rate = rate
+        self.__duration = duration
+        self.__workers = workers
+        self.__stats = stats
+
+        # Shared schedule: operation n is due at start + n / rate
+        self.__next_op = 0
+        self.__schedule_lock = threading.Lock()
+        self.__start = 0.0
+
+        # Lights with an operation in flight, never picked by another worker
+        self.__busy: set[int] = set()
+
+        # Lights with a pushbutton fade in progress, ended on their next turn
+        self.__fading: set[int] = set()
+
+    def __next_due(self) -> float | None:
+        """Returns the time the next operation is due, None when the test is over"""
+        with self.__schedule_lock:
+            if self.__rate > 0:
+                due = self.__start + self.__next_op / self.__rate
+            else:
+                due = time.perf_counter()
+            self.__next_op += 1
+
+        if due >= self.__start + self.__duration:
+            return None
+        return due
+
+    def __pick(self) -> tuple[int, str]:
+        """Picks an idle light and the operation to run on it"""
+        with self.__schedule_lock:
+            # Workers never outnumber lights, so an idle light always exists
+            index = random.randrange(len(self.__lights))
+            while index in self.__busy:
+                index = random.randrange(len(self.__lights))
+            self.__busy.add(index)
+
+            if index in self.__fading:
+                operation = "pfend"
+                self.__fading.discard(index)
+            else:
+                operation = random.choices(self.__operations, self.__weights)[0]
+                if operation == "pfstart":
+                    self.__fading.add(index)
+
+        return index, operation
+
+    def __worker(self) -> None:
+        # One event loop per worker, creating one per operation costs more
+        # than a round trip to the engine
+        loop = asyncio.new_event_loop()
+
+        while True:
+            due = self.__next_due()
+            if due is None:
+                break
+
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            index, operation = self.__pick()
+            loop.run_until_complete(
+                run_operation(self.__lights[index], operation, self.__stats)
+            )
+
+            with self.__schedule_lock:
+                self.__busy.discard(index)
+
+        loop.close()
+
+    def run(self) -> float:
+        """Runs the load test and returns the elapsed time"""
+        self.__start = time.perf_counter()
+
+        threads = [
+            threading.Thread(target=self.__worker) for _ in range(self.__workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return time.perf_counter() - self.__start
+
+    def end_fades(self) -> None:
+        """Ends the pushbutton fades still in progress after the test"""
+        loop = asyncio.new_event_loop()
+
+        for index in self.__fading:
+            try:
+                loop.run_until_complete(self.__lights[index].pushbutton_fade_end())
+            except SendError:
+                pass
+
+        self.__fading.clear()
+        loop.close()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parses command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Load test a Lumize DMX Engine 2 connection"
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--host", help="address of the engine to test")
+    target.add_argument(
+        "--mock", action="store_true", help="run against a local mock engine"
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=DEFAULT_ENTITIES,
+        help="number of simulated light entities (channels 0..N-1)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help="target total ops/sec, 0 for unlimited",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=DEFAULT_DURATION, help="seconds"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="number of threads issuing requests",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help=f"weighted traffic mix of {', '.join(OPERATIONS)} "
+        f"(default: {DEFAULT_MIX})",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=DEFAULT_KEEP_ALIVE,
+        help="keep alive interval in seconds, 0 to disable",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.entities < 1 or args.entities > CHANNELS_PER_UNIVERSE:
+        parser.error(f"--entities must be between 1 and {CHANNELS_PER_UNIVERSE}")
+    if args.workers < 1 or args.workers > args.entities:
+        parser.error("--workers must be between 1 and --entities")
+    if args.rate < 0 or args.duration <= 0:
+        parser.error("--rate must be >= 0 and --duration > 0")
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Load test entry point"""
+    args = parse_args(argv)
+
+    # Start mock engine if requested
+    mock = None
+    host, port = args.host, args.port
+    if args.mock:
+        mock = MockEngine("127.0.0.1", 0)
+        mock.start()
+        host, port = "127.0.0.1", mock.port
+
+    ldmxe2 = LumizeDMXEngine2(host, port, quiet_logger, args.keep_alive)
+    ldmxe2.start()
+
+    # Connections made while starting are not reconnects
+    connect_attempts = ldmxe2.connect_attempts
+    connects = ldmxe2.connects
+
+    lights = [ldmxe2.get_light_entity(channel) for channel in range(args.entities)]
+
+    print(
+        f"Running load test against {host}:{port}: {args.entities} entities, "
+        f"{args.workers} workers, {args.rate or 'unlimited'} ops/sec "
+        f"for {args.duration} s"
+    )
+
+    stats = Stats()
+    load_test = LoadTest(
+        lights, args.mix, args.rate, args.duration, args.workers, stats
+    )
+    elapsed = load_test.run()
+
+    # Take the report before cleaning up, so cleanup traffic is not counted
+    report = stats.report(
+        elapsed,
+        ldmxe2.connect_attempts - connect_attempts,
+        ldmxe2.connects - connects,
+    )
+
+    load_test.end_fades()
+    ldmxe2.stop()
+    if mock is not None:
+        mock.shutdown()
+        mock.server_close()
+
+    print(report)
+
+    return 0
+
+
+# Check if module is being run as program
+if __name__ == "__main__":
+    sys.exit(main())